@@ -191,6 +191,7 @@ class ProfileManager:
         app_data_dir = get_app_data_dir()
         self.profiles_file = app_data_dir / profiles_file
         self.profiles: List[IndexProfile] = []
+        self._by_name: Dict[str, IndexProfile] = {}
         self.load_profiles()
 
     def load_profiles(self):
@@ -208,6 +209,14 @@ class ProfileManager:
         if not self.profiles:
             self.create_default_profiles()
 
+        self._reindex()
+
+    def _reindex(self):
+        """Rebuild the name -> profile lookup (first profile wins on duplicate names)"""
+        self._by_name = {}
+        for profile in self.profiles:
+            self._by_name.setdefault(profile.name, profile)
+
     def save_profiles(self):
         """Save profiles to file"""
         try:
@@ -220,6 +229,7 @@ class ProfileManager:
     def add_profile(self, profile: IndexProfile):
         """Add a new profile"""
         self.profiles.append(profile)
+        self._by_name.setdefault(profile.name, profile)
         self.save_profiles()
 
     def remove_profile(self, profile_name: str) -> bool:
@@ -227,13 +237,19 @@ class ProfileManager:
         original_len = len(self.profiles)
         self.profiles = [p for p in self.profiles if p.name != profile_name]
         if len(self.profiles) < original_len:
+            self._reindex()
             self.save_profiles()
             return True
         return False
 
     def get_profile(self, name: str) -> Optional[IndexProfile]:
         """Get a profile by name"""
-        return next((p for p in self.profiles if p.name == name), None)
+        profile = self._by_name.get(name)
+        if profile is None or profile.name != name:
+            # Profiles can be renamed in place by the editor; refresh the index and retry
+            self._reindex()
+            profile = self._by_name.get(name)
+        return profile
 
     def create_default_profiles(self):
         """Create some default profiles"""
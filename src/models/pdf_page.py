@@ -3,7 +3,7 @@ from pathlib import Path
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class PDFPageData:
     """Represents a single PDF page with metadata"""
     source_path: str
@@ -51,12 +51,18 @@ class PDFPageData:
         return Path(self.source_path).exists()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExportJob:
-    """Represents an export job for a single page"""
+    """Represents an export job for a single page.
+
+    Batch jobs use source_path "BATCH" and carry a pages_group tuple; pages from
+    the same source PDF should be kept adjacent in it so the exporter
+    can reuse one open document for the whole run.
+    """
     source_path: str
     page_number: int
     output_path: str
+    pages_group: tuple = ()  # Pages for "BATCH" jobs
 
     @classmethod
     def from_pdf_page(cls, pdf_page: PDFPageData, base_output_dir: str) -> Optional['ExportJob']:
@@ -1,4 +1,5 @@
 from .pdf_service import PDFService
 from .export_service import ExportService
+from .thumbnail_cache import ThumbnailCache
 
-__all__ = ['PDFService', 'ExportService']
\ No newline at end of file
+__all__ = ['PDFService', 'ExportService', 'ThumbnailCache']
\ No newline at end of file
@@ -1,8 +1,12 @@
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
 from typing import List
 import fitz  # PyMuPDF
 
 from src.models.pdf_page import ExportJob
+from src.services.pdf_service import FITZ_LOCK
+from src.utils.file_utils import FileUtils
 
 
 class ExportService:
@@ -12,9 +16,15 @@ class ExportService:
     @staticmethod
     def export_page(job: ExportJob) -> bool:
         """Export a single page or batch of pages to a new PDF file"""
+        # One job at a time in fitz, clear of the loader and thumbnail threads
+        with FITZ_LOCK:
+            return ExportService._export_page(job)
+
+    @staticmethod
+    def _export_page(job: ExportJob) -> bool:
         try:
             # Check if this is a batch job
-            if hasattr(job, 'pages_group') and job.source_path == "BATCH":
+            if job.source_path == "BATCH":
                 return ExportService.export_pages_batch_to_single_file(job.pages_group, job.output_path)
 
             # Original single page export logic
@@ -22,7 +32,7 @@ class ExportService:
             output_path = Path(job.output_path)
 
             # Ensure the directory structure exists
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            FileUtils.ensure_directory(output_path.parent)
 
             # Ensure the filename ends with .pdf
             if not output_path.suffix.lower() == '.pdf':
@@ -80,17 +90,14 @@ class ExportService:
                     errors.append(f"Job {i + 1}: Source file not found: {job.source_path}")
             else:
                 # For batch jobs, validate that all pages in the group exist
-                if hasattr(job, 'pages_group'):
-                    for page_data in job.pages_group:
-                        if not Path(page_data.source_path).exists():
-                            errors.append(f"Job {i + 1}: Batch source file not found: {page_data.source_path}")
-
-            # Check if output directory can be created
-            try:
-                output_path = Path(job.output_path)
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-            except Exception as e:
-                errors.append(f"Job {i + 1}: Cannot create output directory: {e}")
+                for page_data in job.pages_group:
+                    if not Path(page_data.source_path).exists():
+                        errors.append(f"Job {i + 1}: Batch source file not found: {page_data.source_path}")
+
+            # Check if output directory can be created and written to
+            valid, error = FileUtils.validate_output_path(job.output_path)
+            if not valid:
+                errors.append(f"Job {i + 1}: {error}")
 
             # Check if output file already exists (warning, not error)
             if Path(job.output_path).exists():
@@ -124,33 +131,39 @@ class ExportService:
 
     @staticmethod
     def export_pages_batch_to_single_file(pages_group: List, output_path: str) -> bool:
-        """Export multiple pages from potentially different PDFs into a single output file"""
-        try:
-            from src.models.pdf_page import PDFPageData
+        """Export multiple pages from potentially different PDFs into a single output file
 
+        Consecutive pages that share a source PDF are copied from a single open
+        document, so each source is opened once per run rather than once per page.
+        """
+        try:
             # Create output directory if it doesn't exist
             output_file_path = Path(output_path)
-            output_file_path.parent.mkdir(parents=True, exist_ok=True)
+            FileUtils.ensure_directory(output_file_path.parent)
 
             # Create new document for the combined output
             new_doc = fitz.open()
 
-            # Add each page to the new document
-            for page_data in pages_group:
+            # Add each run of pages to the new document
+            for source_path, source_pages in groupby(pages_group, key=attrgetter('source_path')):
                 try:
-                    # Open source PDF
-                    source_doc = fitz.open(page_data.source_path)
-
-                    # Insert the specific page
-                    new_doc.insert_pdf(source_doc, from_page=page_data.page_number, to_page=page_data.page_number)
-
-                    # Close source document
-                    source_doc.close()
-
+                    # Open source PDF once for the whole run
+                    source_doc = fitz.open(source_path)
                 except Exception as e:
-                    print(f"Error adding page {page_data.page_number} from {page_data.source_path}: {e}")
+                    print(f"Error opening {source_path}: {e}")
                     continue
 
+                for page_data in source_pages:
+                    try:
+                        # Insert the specific page
+                        new_doc.insert_pdf(source_doc, from_page=page_data.page_number, to_page=page_data.page_number)
+                    except Exception as e:
+                        print(f"Error adding page {page_data.page_number} from {source_path}: {e}")
+                        continue
+
+                # Close source document
+                source_doc.close()
+
             # Save the combined document
             new_doc.save(str(output_file_path))
             new_doc.close()
@@ -159,4 +172,4 @@ class ExportService:
 
         except Exception as e:
             print(f"Error creating batch export {output_path}: {e}")
-            return False
\ No newline at end of file
+            return False
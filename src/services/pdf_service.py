@@ -1,8 +1,14 @@
+import threading
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional, Tuple
 import fitz  # PyMuPDF
 
 from src.models.pdf_page import PDFPageData
+from src.services.thumbnail_cache import ThumbnailCache
+
+# PyMuPDF isn't safe to use from several threads at once; the loader, thumbnail
+# and export threads take this lock around each piece of fitz work
+FITZ_LOCK = threading.RLock()
 
 
 class PDFService:
@@ -41,17 +47,18 @@ class PDFService:
         pages = []
 
         try:
-            doc = fitz.open(pdf_path)
+            with FITZ_LOCK:
+                doc = fitz.open(pdf_path)
+                page_count = doc.page_count
+                doc.close()
 
-            for page_num in range(doc.page_count):
+            for page_num in range(page_count):
                 page_data = PDFPageData(
                     source_path=pdf_path,
                     page_number=page_num
                 )
                 pages.append(page_data)
 
-            doc.close()
-
         except Exception as e:
             print(f"Error loading pages from {pdf_path}: {e}")
             return []
@@ -59,31 +66,73 @@ class PDFService:
         return pages
 
     @staticmethod
-    def get_page_thumbnail(pdf_path: str, page_number: int, scale: float = 0.3) -> Optional[bytes]:
-        """Generate a thumbnail image for a specific page"""
-        try:
-            doc = fitz.open(pdf_path)
-            page = doc[page_number]
+    def _thumbnail_matrix(page, scale: float, target_size: Optional[Tuple[int, int]]):
+        """Zoom matrix for a thumbnail, fitting target_size (w, h) when given"""
+        if target_size:
+            width, height = target_size
+            rect = page.rect
+            scale = min(width / rect.width, height / rect.height)
+        return fitz.Matrix(scale, scale)
 
-            # Generate thumbnail
-            matrix = fitz.Matrix(scale, scale)
-            pix = page.get_pixmap(matrix=matrix)
-            img_data = pix.tobytes("png")
-
-            doc.close()
+    @staticmethod
+    def get_page_thumbnail(pdf_path: str, page_number: int, scale: float = 0.3,
+                           target_size: Optional[Tuple[int, int]] = None) -> Optional[bytes]:
+        """Generate a thumbnail image for a specific page.
+
+        With target_size the page is rasterised directly to fit (width, height),
+        keeping its aspect ratio, so callers don't have to rescale it.
+        """
+        for _, img_data in PDFService.iter_page_thumbnails(pdf_path, [page_number],
+                                                           scale, target_size):
             return img_data
+        return None
 
-        except Exception as e:
-            print(f"Error generating thumbnail for {pdf_path} page {page_number}: {e}")
-            return None
+    @staticmethod
+    def iter_page_thumbnails(pdf_path: str, page_numbers: Iterable[int], scale: float = 0.3,
+                             target_size: Optional[Tuple[int, int]] = None
+                             ) -> Iterator[Tuple[int, Optional[bytes]]]:
+        """Generate thumbnails for several pages of one PDF, opening it only once.
+
+        Yields (page_number, png_bytes) as each page is ready; png_bytes is None
+        for pages that fail. Pages found in the disk cache are returned without
+        opening the PDF at all.
+        """
+        source_key = ThumbnailCache.source_key(pdf_path)
+        size_tag = f"{target_size[0]}x{target_size[1]}" if target_size else f"s{scale}"
+        doc = None
+
+        try:
+            for page_number in page_numbers:
+                img_data = ThumbnailCache.load(source_key, page_number, size_tag)
+
+                if img_data is None:
+                    try:
+                        with FITZ_LOCK:
+                            if doc is None:
+                                doc = fitz.open(pdf_path)
+                            page = doc[page_number]
+
+                            # Generate thumbnail
+                            matrix = PDFService._thumbnail_matrix(page, scale, target_size)
+                            img_data = page.get_pixmap(matrix=matrix).tobytes("png")
+                        ThumbnailCache.store(source_key, page_number, size_tag, img_data)
+                    except Exception as e:
+                        print(f"Error generating thumbnail for {pdf_path} page {page_number}: {e}")
+
+                yield page_number, img_data
+        finally:
+            if doc is not None:
+                with FITZ_LOCK:
+                    doc.close()
 
     @staticmethod
     def get_page_count(pdf_path: str) -> int:
         """Get the number of pages in a PDF"""
         try:
-            doc = fitz.open(pdf_path)
-            count = doc.page_count
-            doc.close()
+            with FITZ_LOCK:
+                doc = fitz.open(pdf_path)
+                count = doc.page_count
+                doc.close()
             return count
         except Exception:
             return 0
@@ -92,8 +141,9 @@ class PDFService:
     def validate_pdf_file(pdf_path: str) -> bool:
         """Check if a file is a valid PDF"""
         try:
-            doc = fitz.open(pdf_path)
-            doc.close()
+            with FITZ_LOCK:
+                doc = fitz.open(pdf_path)
+                doc.close()
             return True
         except Exception:
             return False
\ No newline at end of file
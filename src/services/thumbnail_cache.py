@@ -0,0 +1,143 @@
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+
+def get_cache_dir() -> Path:
+    """Get the directory rendered thumbnails are cached in"""
+    if os.name == 'nt':  # Windows
+        base = os.environ.get('LOCALAPPDATA')
+        base_dir = Path(base) if base else Path.home() / "AppData" / "Local"
+    else:  # macOS/Linux
+        base = os.environ.get('XDG_CACHE_HOME')
+        base_dir = Path(base) if base else Path.home() / ".cache"
+
+    return base_dir / "PDFPageExtractor" / "thumbs"
+
+
+class ThumbnailCache:
+    """Two-level cache of rendered page thumbnails (PNG bytes).
+
+    Recently used thumbnails are kept in a bounded in-memory LRU in front of
+    the on-disk cache. Entries are keyed by the source file's absolute path
+    and mtime, so editing or renaming a PDF simply stops its old entries from
+    being found; prune() removes them from disk once they are old enough.
+    """
+
+    MAX_AGE_DAYS = 30
+    MEMORY_ENTRIES = 256  # ~16 MiB at ~64 KiB per thumbnail
+
+    _cache_dir: Optional[Path] = None
+    _created_dirs = set()
+
+    # Shared by the thumbnail workers on the thread pool
+    _memory: "OrderedDict[tuple, bytes]" = OrderedDict()
+    _memory_lock = threading.Lock()
+
+    @staticmethod
+    def cache_dir() -> Path:
+        if ThumbnailCache._cache_dir is None:
+            ThumbnailCache._cache_dir = get_cache_dir()
+        return ThumbnailCache._cache_dir
+
+    @staticmethod
+    def source_key(pdf_path: str) -> Optional[str]:
+        """Identify the current version of a PDF, or None if it can't be stat'ed"""
+        try:
+            mtime_ns = os.stat(pdf_path).st_mtime_ns
+        except OSError:
+            return None
+        return f"{os.path.abspath(pdf_path)}|{mtime_ns}"
+
+    @staticmethod
+    def _entry_path(source_key: str, page_number: int, size_tag: str) -> Path:
+        key = hashlib.blake2b(f"{source_key}|{page_number}|{size_tag}".encode("utf-8"),
+                              digest_size=12).hexdigest()
+        return ThumbnailCache.cache_dir() / key[:2] / f"{key}.png"
+
+    @staticmethod
+    def _remember(key: tuple, img_data: bytes):
+        with ThumbnailCache._memory_lock:
+            ThumbnailCache._memory[key] = img_data
+            ThumbnailCache._memory.move_to_end(key)
+            if len(ThumbnailCache._memory) > ThumbnailCache.MEMORY_ENTRIES:
+                ThumbnailCache._memory.popitem(last=False)
+
+    @staticmethod
+    def load(source_key: Optional[str], page_number: int, size_tag: str) -> Optional[bytes]:
+        """Return cached PNG bytes, or None on a miss"""
+        if source_key is None:
+            return None
+
+        key = (source_key, page_number, size_tag)
+        with ThumbnailCache._memory_lock:
+            img_data = ThumbnailCache._memory.get(key)
+            if img_data is not None:
+                ThumbnailCache._memory.move_to_end(key)
+                return img_data
+
+        try:
+            with open(ThumbnailCache._entry_path(source_key, page_number, size_tag), "rb") as f:
+                img_data = f.read()
+        except OSError:
+            return None
+
+        ThumbnailCache._remember(key, img_data)
+        return img_data
+
+    @staticmethod
+    def clear_memory():
+        """Drop the in-memory entries (the disk cache is kept)"""
+        with ThumbnailCache._memory_lock:
+            ThumbnailCache._memory.clear()
+
+    @staticmethod
+    def store(source_key: Optional[str], page_number: int, size_tag: str, img_data: bytes):
+        """Write PNG bytes to the cache; failures are ignored"""
+        if source_key is None:
+            return
+
+        ThumbnailCache._remember((source_key, page_number, size_tag), img_data)
+
+        entry = ThumbnailCache._entry_path(source_key, page_number, size_tag)
+        try:
+            if entry.parent not in ThumbnailCache._created_dirs:
+                entry.parent.mkdir(parents=True, exist_ok=True)
+                ThumbnailCache._created_dirs.add(entry.parent)
+
+            # Write to a temp file and rename so readers never see a partial PNG
+            fd, tmp_path = tempfile.mkstemp(dir=entry.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(img_data)
+                os.replace(tmp_path, entry)
+            except OSError:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            pass
+
+    @staticmethod
+    def prune(max_age_days: int = MAX_AGE_DAYS):
+        """Delete cache entries older than max_age_days"""
+        cutoff = time.time() - max_age_days * 86400
+
+        try:
+            subdirs = list(os.scandir(ThumbnailCache.cache_dir()))
+        except OSError:
+            return
+
+        for subdir in subdirs:
+            if not subdir.is_dir():
+                continue
+            try:
+                for entry in os.scandir(subdir.path):
+                    if entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+            except OSError:
+                continue
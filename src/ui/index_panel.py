@@ -103,6 +103,7 @@ class ProfileEditor(QDialog):
         else:
             self.profile = profile.clone() if profile else IndexProfile("New Profile")
         self.field_editors = []
+        self._folder_dialog: Optional[QFileDialog] = None  # Created on first browse
         self.setup_ui()
         self.set_window_icon()
 
@@ -187,13 +188,33 @@ class ProfileEditor(QDialog):
         self.setLayout(layout)
         self.refresh_fields()
 
+    def choose_folder(self, title: str, current_folder: str) -> str:
+        """Show the shared folder picker and return the chosen folder, or "" if cancelled"""
+        dialog = self._folder_dialog
+        if dialog is None:
+            # Owned by this editor and reused by both Browse buttons, so its file
+            # system model is only populated once per editor
+            dialog = QFileDialog(self)
+            dialog.setFileMode(QFileDialog.Directory)
+            dialog.setOption(QFileDialog.ShowDirsOnly, True)
+            dialog.setOption(QFileDialog.DontUseCustomDirectoryIcons, True)
+            self._folder_dialog = dialog
+
+        dialog.setWindowTitle(title)
+        if current_folder and Path(current_folder).is_dir():
+            dialog.setDirectory(current_folder)
+
+        if dialog.exec() == QDialog.Accepted and dialog.selectedFiles():
+            return dialog.selectedFiles()[0]
+        return ""
+
     def browse_input_folder(self):
-        folder = QFileDialog.getExistingDirectory(self, "Select Input Folder")
+        folder = self.choose_folder("Select Input Folder", self.input_folder_input.text())
         if folder:
             self.input_folder_input.setText(folder)
 
     def browse_output_folder(self):
-        folder = QFileDialog.getExistingDirectory(self, "Select Output Folder")
+        folder = self.choose_folder("Select Output Folder", self.output_folder_input.text())
         if folder:
             self.output_folder_input.setText(folder)
 
@@ -363,8 +384,15 @@ class IndexPanel(QWidget):
         self.profile_manager = ProfileManager()
         self.current_profile: Optional[IndexProfile] = None
         self.field_editors: List[FieldEditor] = []
+        self._populated = False
         self.setup_ui()
-        self.refresh_profiles()
+
+    def showEvent(self, event):
+        """Populate profiles and field editors the first time the panel is shown"""
+        if not self._populated:
+            self._populated = True
+            self.refresh_profiles()
+        super().showEvent(event)
 
     def setup_ui(self):
         layout = QVBoxLayout()
@@ -1,20 +1,20 @@
-import re
-from collections import defaultdict
+import copy
+from dataclasses import replace
+from operator import attrgetter
 from pathlib import Path
 
 from PySide6.QtWidgets import (QMainWindow, QVBoxLayout, QHBoxLayout,
                                QWidget, QPushButton, QLabel, QTextEdit,
-                               QFileDialog, QMessageBox, QSplitter,
-                               QGroupBox)
-from PySide6.QtCore import Qt
+                               QMessageBox, QSplitter, QGroupBox)
+from PySide6.QtCore import Qt, QThread, QThreadPool
 from typing import List
 
 from src.models.pdf_page import PDFPageData, ExportJob
 from src.models.index_profile import IndexProfile
+from src.services.thumbnail_cache import ThumbnailCache
 from src.ui.page_list_widget import PageListWidget
 from src.ui.index_panel import IndexPanel
-from src.ui.workers import PDFLoader, PDFExporter
-from src.utils.file_utils import FileUtils
+from src.ui.workers import PDFLoader, PDFExporter, ExportJobBuilder
 
 from PySide6.QtGui import QIcon
 
@@ -25,14 +25,14 @@ class PDFExtractorApp(QMainWindow):
     def __init__(self):
         super().__init__()
         self.output_folder = None
-        self.loader = None  # Initialize thread references
-        self.exporter = None
+        self.exporter = None  # Initialize thread references
+        self.job_builder = None
+        self._last_btn_state = (None, None)  # (enabled, text) last applied to export_btn
         self.setup_ui()
+        self.setup_loader()
 
-        # Connect index panel signals
-        self.index_panel.profile_folders_changed.connect(self.load_from_profile_folders)
-
-
+        # Drop stale disk-cached thumbnails without holding up startup
+        QThreadPool.globalInstance().start(ThumbnailCache.prune)
 
     def setup_ui(self):
         self.setWindowTitle("PDF Page Extractor - Index & Extract")
@@ -86,7 +86,8 @@ class PDFExtractorApp(QMainWindow):
 
         # Left panel - Page list (bigger)
         self.page_list = PageListWidget()
-        self.page_list.selection_changed.connect(self.on_page_selection_changed)
+        self.page_list.selection_changed.connect(self.on_page_selection_changed, Qt.DirectConnection)
+        self.page_list.renames_changed.connect(self.update_export_button_state, Qt.DirectConnection)
         self.main_splitter.addWidget(self.page_list)
 
         # Right panel with vertical layout for index panel and status
@@ -95,8 +96,10 @@ class PDFExtractorApp(QMainWindow):
 
         # Index assignment panel
         self.index_panel = IndexPanel()
-        self.index_panel.profile_applied.connect(self.apply_profile_to_selected)
-        self.index_panel.batch_assignment_requested.connect(self.batch_assign_profile)
+        self.index_panel.profile_applied.connect(self.apply_profile_to_selected, Qt.DirectConnection)
+        self.index_panel.batch_assignment_requested.connect(self.batch_assign_profile, Qt.DirectConnection)
+        self.index_panel.profile_folders_changed.connect(self.load_from_profile_folders,
+                                                          Qt.DirectConnection)
         right_layout.addWidget(self.index_panel)
 
         # Status area (bottom right)
@@ -129,6 +132,22 @@ class PDFExtractorApp(QMainWindow):
         self.status_text.append("4. Apply profile to selected pages")
         self.status_text.append("5. Set output folder and export")
 
+    def setup_loader(self):
+        """Start the persistent PDF loader worker on its own thread"""
+        self.loader_thread = QThread(self)
+        self.loader = PDFLoader()
+        self.loader.moveToThread(self.loader_thread)
+
+        # Worker signals cross threads, so they are always queued to the GUI thread
+        self.loader.progress.connect(self.status_text.append, Qt.QueuedConnection)
+        self.loader.pages_chunk.connect(self.on_pages_chunk, Qt.QueuedConnection)
+        self.loader.pages_loaded.connect(self.on_pages_loaded, Qt.QueuedConnection)
+        self.loader.error.connect(self.on_load_error, Qt.QueuedConnection)
+        self.loader.finished.connect(self.on_load_finished, Qt.QueuedConnection)
+        self.loader_thread.finished.connect(self.loader.deleteLater)
+
+        self.loader_thread.start()
+
     def load_from_profile_folders(self, input_folder: str, output_folder: str):
         """Load PDFs from profile input folder and set output folder"""
         if input_folder:
@@ -153,13 +172,8 @@ class PDFExtractorApp(QMainWindow):
 
     def load_pdfs(self, folder_path: str):
         """Load PDFs from folder in background thread"""
-        # Stop any existing loader
-        if self.loader and self.loader.isRunning():
-            self.loader.stop()
-            self.loader.wait(1000)
-            self.cleanup_loader()
-
         self.page_list.clear_pages()
+        ThumbnailCache.clear_memory()  # Previous folder's thumbnails stay on disk only
         self.status_text.clear()
         self.status_text.append("Loading PDFs from folder...")
         self.status_text.append(f"Scanning: {folder_path}")
@@ -167,23 +181,28 @@ class PDFExtractorApp(QMainWindow):
         # Disable buttons during loading
         self.set_buttons_enabled(False)
 
-        # Start loading thread
-        self.loader = PDFLoader(folder_path)
-        self.loader.progress.connect(self.status_text.append)
-        self.loader.pages_loaded.connect(self.on_pages_loaded)
-        self.loader.error.connect(self.on_load_error)
-        self.loader.finished.connect(self.cleanup_loader)
-        self.loader.finished.connect(lambda: self.set_buttons_enabled(True))
-        self.loader.start()
+        # Queue the scan on the loader thread; this cancels any scan in progress
+        self.loader.request_load(folder_path)
 
-    def on_pages_loaded(self, pages: List[PDFPageData]):
+    def on_pages_chunk(self, pages: List[PDFPageData], generation: int):
+        """Append a chunk of freshly loaded pages to the page list"""
+        # Chunks queued by a scan that has since been superseded are dropped
+        if generation != self.loader.generation:
+            return
+
+        self.page_list.append_pages(pages)
+
+    def on_pages_loaded(self, total_pages: int):
         """Handle successful page loading"""
-        self.page_list.load_pages(pages)
-        self.status_text.append(f"✓ Loaded {len(pages)} pages successfully!")
+        self.status_text.append(f"✓ Loaded {total_pages} pages successfully!")
         self.status_text.append("Select pages and assign index profiles to continue.")
 
         self.update_export_button_state()
 
+    def on_load_finished(self):
+        """Re-enable buttons once the loader is done with the current scan"""
+        self.set_buttons_enabled(True)
+
     def on_load_error(self, error_message: str):
         """Handle loading errors"""
         self.status_text.append(f"❌ Error: {error_message}")
@@ -240,6 +259,11 @@ class PDFExtractorApp(QMainWindow):
     def export_all_assigned(self):
         """Export all pages that have assigned profiles"""
         try:
+            # Source PDFs being renamed to done- would still be read from their old path
+            if self.page_list.has_pending_renames():
+                self.status_text.append("Waiting for processed source files to be renamed...")
+                return
+
             self.status_text.append("Starting export process...")
 
             # Get all pages with assigned profiles
@@ -253,97 +277,35 @@ class PDFExtractorApp(QMainWindow):
 
             self.status_text.append(f"Found {len(pages_to_export)} pages to export")
 
-            # Group pages by their batch_id if they have one, otherwise individual files
-            profile_groups = defaultdict(list)
+            # Resolve assigned profiles up front; every one needs somewhere to export to
+            profiles = {}
             profile_manager = self.index_panel.profile_manager
 
-            for page_data in pages_to_export:
-                try:
-                    profile = profile_manager.get_profile(page_data.assigned_profile)
-                    if profile:
-                        # Use profile's output folder if set, otherwise use app's output folder
-                        output_base = profile.output_folder or self.output_folder
-
-                        if not output_base:
-                            QMessageBox.warning(self, "No Output Folder",
-                                                "Please set an output folder in the profile or use 'Set Output Folder' button.")
-                            return
-
-                        # Generate base output path using profile with page-specific field values
-                        field_values = getattr(page_data, 'profile_field_values', {})
-                        if field_values:
-                            self.status_text.append(f"Using stored field values for page {page_data.page_number + 1}")
-                            output_path = profile.generate_output_path_with_values(output_base, field_values)
-                        else:
-                            self.status_text.append(
-                                f"No stored field values for page {page_data.page_number + 1}, using current profile values")
-                            output_path = profile.generate_output_path(output_base)
-
-                        if not output_path.endswith('.pdf'):
-                            output_path += '.pdf'
-
-                        # Group by batch_id if present, otherwise use individual paths
-                        if hasattr(page_data, 'batch_id') and page_data.batch_id:
-                            # For batch items, use batch_id as the grouping key (before .pdf extension)
-                            base_path = output_path.replace('.pdf', '')
-                            group_key = f"{base_path}.pdf"
-                        else:
-                            # For individual items, make each page unique
-                            base_path = output_path.replace('.pdf', '')
-                            group_key = f"{base_path}_{page_data.page_number}.pdf"
-
-                        profile_groups[group_key].append(page_data)
-
-                except Exception as e:
-                    self.status_text.append(f"Error processing page {page_data.page_number + 1}: {str(e)}")
-                    continue
-
-            # Create batch export jobs - one job per group
-            export_jobs = []
-            for output_path, pages_group in profile_groups.items():
-                try:
-                    # Ensure unique filename for this batch
-                    from src.utils.file_utils import FileUtils
-                    final_output_path = FileUtils.ensure_unique_filename(output_path)
-
-                    # Create a single job that will contain all pages for this profile/path
-                    job = ExportJob(
-                        source_path="BATCH",  # Special marker for batch jobs
-                        page_number=0,  # Not used for batch jobs
-                        output_path=final_output_path
-                    )
-                    job.pages_group = pages_group  # Add the pages group to the job
-                    export_jobs.append(job)
-                    self.status_text.append(f"Created export job: {final_output_path}")
-
-                except Exception as e:
-                    self.status_text.append(f"Error creating export job for {output_path}: {str(e)}")
-                    continue
-
-            if not export_jobs:
-                QMessageBox.information(self, "No Valid Jobs",
-                                        "No valid export jobs could be created.")
-                return
-
-            self.status_text.append(f"Created {len(export_jobs)} export jobs")
-
-            # Start export
-            # Stop any existing exporter
-            if self.exporter and self.exporter.isRunning():
-                self.exporter.stop()
-                self.exporter.wait(1000)
-                self.cleanup_exporter()
-
-            self.status_text.append(f"Starting export of {len(export_jobs)} jobs...")
+            for profile_name in {p.assigned_profile for p in pages_to_export}:
+                profile = profile_manager.get_profile(profile_name)
+                if profile:
+                    # Use profile's output folder if set, otherwise use app's output folder
+                    if not (profile.output_folder or self.output_folder):
+                        QMessageBox.warning(self, "No Output Folder",
+                                            "Please set an output folder in the profile or use 'Set Output Folder' button.")
+                        return
+                    # The builder works on a copy, as the GUI can keep editing profiles
+                    profiles[profile_name] = copy.deepcopy(profile)
+
+            # Same for the pages: the builder and exporter get their values as of now
+            pages_to_export = [
+                replace(p, profile_field_values=dict(p.profile_field_values))
+                for p in pages_to_export
+            ]
+
+            # Build the jobs on a pool thread; start_export picks them up
             self.set_buttons_enabled(False)
 
-            self.exporter = PDFExporter(export_jobs)
-            self.exporter.progress.connect(self.status_text.append)
-            self.exporter.export_complete.connect(self.on_export_complete)
-            self.exporter.error.connect(self.on_export_error)
-            self.exporter.finished.connect(self.cleanup_exporter)
-            self.exporter.finished.connect(lambda: self.set_buttons_enabled(True))
-            self.exporter.start()
+            self.job_builder = ExportJobBuilder(pages_to_export, profiles, self.output_folder)
+            self.job_builder.signals.progress.connect(self.status_text.append, Qt.QueuedConnection)
+            self.job_builder.signals.jobs_ready.connect(self.start_export, Qt.QueuedConnection)
+            self.job_builder.signals.error.connect(self.on_job_builder_error, Qt.QueuedConnection)
+            QThreadPool.globalInstance().start(self.job_builder)
 
         except Exception as e:
             self.status_text.append(f"Critical error in export_all_assigned: {str(e)}")
@@ -351,13 +313,41 @@ class PDFExtractorApp(QMainWindow):
             self.status_text.append(f"Traceback: {traceback.format_exc()}")
             QMessageBox.critical(self, "Export Error", f"Critical error during export: {str(e)}")
 
+    def start_export(self, export_jobs: List[ExportJob]):
+        """Start the exporter thread once export jobs have been built"""
+        self.job_builder = None
 
+        if not export_jobs:
+            self.set_buttons_enabled(True)
+            QMessageBox.information(self, "No Valid Jobs",
+                                    "No valid export jobs could be created.")
+            return
 
-    def cleanup_loader(self):
-        """Clean up the loader thread"""
-        if self.loader:
-            self.loader.deleteLater()
-            self.loader = None
+        self.status_text.append(f"Created {len(export_jobs)} export jobs")
+
+        # Stop any existing exporter
+        if self.exporter and self.exporter.isRunning():
+            self.exporter.stop()
+            self.exporter.wait(1000)
+            self.cleanup_exporter()
+
+        self.status_text.append(f"Starting export of {len(export_jobs)} jobs...")
+        self.set_buttons_enabled(False)
+
+        self.exporter = PDFExporter(export_jobs)
+        self.exporter.progress.connect(self.status_text.append, Qt.QueuedConnection)
+        self.exporter.progress_batch.connect(self.on_export_progress, Qt.QueuedConnection)
+        self.exporter.export_complete.connect(self.on_export_complete, Qt.QueuedConnection)
+        self.exporter.error.connect(self.on_export_error, Qt.QueuedConnection)
+        self.exporter.finished.connect(self.cleanup_exporter, Qt.QueuedConnection)
+        self.exporter.finished.connect(lambda: self.set_buttons_enabled(True), Qt.QueuedConnection)
+        self.exporter.start()
+
+    def on_job_builder_error(self, error_message: str):
+        """Handle failures while building export jobs"""
+        self.job_builder = None
+        self.set_buttons_enabled(True)
+        self.on_export_error(error_message)
 
     def cleanup_exporter(self):
         """Clean up the exporter thread"""
@@ -365,6 +355,10 @@ class PDFExtractorApp(QMainWindow):
             self.exporter.deleteLater()
             self.exporter = None
 
+    def on_export_progress(self, done: int, total: int, message: str):
+        """Show the latest per-job export result"""
+        self.status_text.append(f"[{done}/{total}] {message}")
+
     def on_export_complete(self, results):
         """Handle successful export completion"""
         successful = sum(1 for r in results if r['success'])
@@ -386,29 +380,36 @@ class PDFExtractorApp(QMainWindow):
 
     def update_export_button_state(self):
         """Enable/disable export button based on current state"""
-        has_assigned_pages = any(p.assigned_profile for p in self.page_list.get_all_pages())
+        # Collect assigned profile names in a single C-level pass over the pages
+        assigned_profiles = list(filter(None, map(attrgetter('assigned_profile'), self.page_list.get_all_pages())))
+        assigned_count = len(assigned_profiles)
+        has_assigned_pages = bool(assigned_count)
 
         # Check if assigned profiles have output folders OR app has output folder
-        all_pages = self.page_list.get_all_pages()
         profile_manager = self.index_panel.profile_manager
         has_valid_outputs = bool(self.output_folder)  # App has output folder
 
         if not has_valid_outputs:
             # Check if assigned profiles have output folders
-            for page in all_pages:
-                if page.assigned_profile:
-                    profile = profile_manager.get_profile(page.assigned_profile)
-                    if profile and profile.output_folder:
-                        has_valid_outputs = True
-                        break
-
-        self.export_btn.setEnabled(has_assigned_pages and has_valid_outputs)
+            for profile_name in set(assigned_profiles):
+                profile = profile_manager.get_profile(profile_name)
+                if profile and profile.output_folder:
+                    has_valid_outputs = True
+                    break
 
         if has_assigned_pages:
-            assigned_count = sum(1 for p in all_pages if p.assigned_profile)
-            self.export_btn.setText(f"Export {assigned_count} Assigned Pages")
+            text = f"Export {assigned_count} Assigned Pages"
         else:
-            self.export_btn.setText("Export All Assigned Pages")
+            text = "Export All Assigned Pages"
+
+        # Only touch the button (and trigger a restyle/repaint) when its state changes;
+        # exporting waits until processed sources have their done- names
+        enabled = has_assigned_pages and has_valid_outputs and not self.page_list.has_pending_renames()
+        state = (enabled, text)
+        if state != self._last_btn_state:
+            self.export_btn.setEnabled(state[0])
+            self.export_btn.setText(state[1])
+            self._last_btn_state = state
 
     def set_buttons_enabled(self, enabled: bool):
         """Enable/disable all buttons during processing"""
@@ -418,16 +419,16 @@ class PDFExtractorApp(QMainWindow):
             self.update_export_button_state()
         else:
             self.export_btn.setEnabled(False)
+            self._last_btn_state = (False, self._last_btn_state[1])
 
     def closeEvent(self, event):
         """Handle application close event to properly cleanup threads"""
-        # Stop loader thread
-        if self.loader and self.loader.isRunning():
-            self.loader.stop()
-            if not self.loader.wait(2000):
-                self.loader.terminate()
-                self.loader.wait(500)
-            self.loader = None
+        # Stop loader thread; a PDF still being opened can't be interrupted
+        self.loader.stop()
+        self.loader_thread.quit()
+        if not self.loader_thread.wait(2000):
+            self.loader_thread.terminate()
+            self.loader_thread.wait(500)
 
         # Stop exporter thread
         if self.exporter and self.exporter.isRunning():
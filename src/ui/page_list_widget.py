@@ -2,24 +2,76 @@ from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout,
                                QListWidget, QListWidgetItem, QPushButton,
                                QLabel, QCheckBox, QLineEdit, QGroupBox,
                                QScrollArea, QGridLayout)
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QPixmap
-from typing import List
+from PySide6.QtCore import (Qt, Signal, QCoreApplication, QEvent, QPoint, QRect,
+                            QSize, QThreadPool, QTimer)
+from PySide6.QtGui import QImage, QPixmap, QPixmapCache
+import threading
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from itertools import compress
+from typing import Dict, List, Optional
 
 from src.models.pdf_page import PDFPageData
-from src.services.pdf_service import PDFService
+from src.ui.workers import (ThumbnailWorker, ThumbnailWorkerSignals,
+                            RenameWorker, RenameWorkerSignals)
+
+# Scaled thumbnails are shared process-wide so reloading a folder reuses them
+QPixmapCache.setCacheLimit(64 * 1024)  # KB
+
+THUMBNAIL_SIZE = QSize(78, 98)
+
+# Installed once on PageListWidget; items switch between looks via their "state"
+# property and profile labels via "assigned"
+PAGE_LIST_STYLE_SHEET = """
+    PageListItem[state="assigned"] {
+        background-color: #e8f5e8;
+        border: 2px solid #4CAF50;
+        border-radius: 4px;
+    }
+    PageListItem[state="selected"] {
+        background-color: #e3f2fd;
+        border: 2px solid #2196F3;
+        border-radius: 4px;
+    }
+    PageListItem[state="default"] {
+        background-color: white;
+        border: 1px solid #ddd;
+        border-radius: 4px;
+    }
+    PageListItem[state="default"]:hover {
+        border-color: #2196F3;
+    }
+    QLabel#pageInfoLabel {
+        font-size: 10px;
+        font-weight: bold;
+    }
+    QLabel#filenameLabel {
+        font-size: 9px;
+        color: #666;
+    }
+    QLabel#profileLabel {
+        font-size: 9px;
+        color: #999;
+    }
+    QLabel#profileLabel[assigned="true"] {
+        color: #2196F3;
+        font-weight: bold;
+    }
+"""
 
 
 class PageListItem(QWidget):
     """Compact widget for displaying a page in the list"""
 
-    selection_changed = Signal(bool)  # selected state
+    _bulk_mode = False  # Set by PageListWidget while it updates many items at once
 
-    def __init__(self, page_data: PDFPageData):
-        super().__init__()
+    def __init__(self, page_data: PDFPageData, parent: QWidget = None):
+        super().__init__(parent)
         self.page_data = page_data
+        self._owner: Optional['PageListWidget'] = None  # Notified directly of selection changes
+        self.has_thumbnail = False
+        self.update_filter_haystack()
         self.setup_ui()
-        self.load_thumbnail()
 
     def setup_ui(self):
         layout = QVBoxLayout()
@@ -39,21 +91,20 @@ class PageListItem(QWidget):
 
         # Page info
         info_label = QLabel(f"Pg {self.page_data.page_number + 1}")
+        info_label.setObjectName("pageInfoLabel")
         info_label.setAlignment(Qt.AlignCenter)
-        info_label.setStyleSheet("font-size: 10px; font-weight: bold;")
         layout.addWidget(info_label)
 
-        # Source filename (truncated)
-        filename = self.page_data.source_filename
-        if len(filename) > 15:
-            filename = filename[:12] + "..."
-        filename_label = QLabel(filename)
+        # Source filename (elided once the label has its styled font)
+        filename_label = QLabel()
+        filename_label.setObjectName("filenameLabel")
         filename_label.setAlignment(Qt.AlignCenter)
-        filename_label.setStyleSheet("font-size: 9px; color: #666;")
+        filename_label.setToolTip(self.page_data.source_filename)
         layout.addWidget(filename_label)
 
         # Profile assignment status
         self.profile_label = QLabel("No profile assigned")
+        self.profile_label.setObjectName("profileLabel")
         self.profile_label.setAlignment(Qt.AlignCenter)
         self.profile_label.setWordWrap(True)
         layout.addWidget(self.profile_label)
@@ -61,144 +112,85 @@ class PageListItem(QWidget):
 
         self.setLayout(layout)
         self.setFixedSize(100, 180)
+        self.setAttribute(Qt.WA_StyledBackground, True)  # Paint the state background/border from QSS
+
+        # Elide to the label's width (item width minus margins), measured with
+        # the font size PageListWidget's sheet gives it
+        filename_label.ensurePolished()
+        filename_label.setText(filename_label.fontMetrics().elidedText(
+            self.page_data.source_filename, Qt.ElideMiddle, 92
+        ))
 
         # Set initial styling
         self.update_selection_style()
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
-            # Handle Ctrl+click for multi-select
-            if event.modifiers() == Qt.ControlModifier:
-                self.checkbox.setChecked(not self.checkbox.isChecked())
-            else:
-                self.checkbox.setChecked(not self.checkbox.isChecked())
+            # Plain and Ctrl+click both toggle the page
+            self.checkbox.toggle()
         super().mousePressEvent(event)
 
-    def load_thumbnail(self):
-        """Load small thumbnail for this page"""
-        img_data = PDFService.get_page_thumbnail(
-            self.page_data.source_path,
-            self.page_data.page_number,
-            scale=0.2  # Smaller scale for list view
-        )
+    def thumbnail_cache_key(self) -> str:
+        """Key of this page's scaled thumbnail in QPixmapCache"""
+        return f"{self.page_data.source_path}|{self.page_data.page_number}|78x98"
 
-        if img_data:
-            pixmap = QPixmap()
-            pixmap.loadFromData(img_data)
-            pixmap = pixmap.scaled(78, 98, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            self.thumbnail_label.setPixmap(pixmap)
-        else:
+    def load_thumbnail(self) -> bool:
+        """Show the cached thumbnail for this page; returns False if it still needs rendering"""
+        pixmap = QPixmapCache.find(self.thumbnail_cache_key())
+
+        if pixmap is None:
+            # Placeholder until a ThumbnailWorker delivers the image
             self.thumbnail_label.setText(f"{self.page_data.page_number + 1}")
+            return False
+
+        self.thumbnail_label.setPixmap(pixmap)
+        self.has_thumbnail = True
+        return True
+
+    def set_thumbnail_image(self, image: QImage):
+        """Show a thumbnail rendered in the background and cache it"""
+        if image.isNull():
+            return
+
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(self.thumbnail_cache_key(), pixmap)
+        self.thumbnail_label.setPixmap(pixmap)
+        self.has_thumbnail = True
+
+    def release_thumbnail(self):
+        """Go back to the placeholder so QPixmapCache can evict the pixmap"""
+        self.thumbnail_label.setText(f"{self.page_data.page_number + 1}")
+        self.has_thumbnail = False
 
     def on_selection_changed(self, checked: bool):
         """Handle selection state change"""
         self.page_data.selected = checked
         self.update_selection_style()
-        self.selection_changed.emit(checked)
+        if self._owner is not None and not PageListItem._bulk_mode:
+            self._owner.on_item_selection_changed(self)
 
     def update_selection_style(self):
         """Update widget styling based on selection and assignment state"""
         if self.page_data.assigned_profile:
-            # Green for assigned
-            self.setStyleSheet("""
-                PageListItem {
-                    background-color: #e8f5e8;
-                    border: 2px solid #4CAF50;
-                    border-radius: 4px;
-                }
-            """)
+            state = "assigned"  # Green for assigned
         elif self.checkbox.isChecked():
-            # Blue for selected
-            self.setStyleSheet("""
-                PageListItem {
-                    background-color: #e3f2fd;
-                    border: 2px solid #2196F3;
-                    border-radius: 4px;
-                }
-            """)
+            state = "selected"  # Blue for selected
         else:
-            # Default styling
-            self.setStyleSheet("""
-                PageListItem {
-                    background-color: white;
-                    border: 1px solid #ddd;
-                    border-radius: 4px;
-                }
-            """)
-
-    def set_selected(self, selected: bool):
-        """Programmatically set selection"""
-        self.checkbox.setChecked(selected)
-        self.update_selection_style()
+            state = "default"
 
-    def assign_profile(self, profile_name: str):
-        """Assign a profile to this page"""
-        self.page_data.assigned_profile = profile_name
-        self.update_profile_label()
-        self.set_assigned_state(True)
-        self.update_selection_style()
+        # The look comes from PageListWidget's sheet; only re-polish on a real change
+        if self.property("state") != state:
+            self.setProperty("state", state)
+            self.style().unpolish(self)
+            self.style().polish(self)
 
-    def set_assigned_state(self, assigned: bool):
-        """Set the assigned state and disable selection if assigned"""
-        if assigned:
-            self.checkbox.setEnabled(False)
-            self.checkbox.setChecked(False)
-            self.update_selection_style()
-        else:
-            self.checkbox.setEnabled(True)
-            self.update_selection_style()
-
-    def update_selection_style(self):
-        """Update widget styling based on selection and assignment state"""
+    def update_filter_haystack(self):
+        """Cache the lowercased text the page list filter searches"""
+        parts = [self.page_data.source_filename.lower(), str(self.page_data.page_number + 1)]
         if self.page_data.assigned_profile:
-            # Green for assigned
-            self.setStyleSheet("""
-                PageListItem {
-                    background-color: #e8f5e8;
-                    border: 2px solid #4CAF50;
-                    border-radius: 4px;
-                }
-            """)
-        elif self.checkbox.isChecked():
-            # Blue for selected
-            self.setStyleSheet("""
-                PageListItem {
-                    background-color: #e3f2fd;
-                    border: 2px solid #2196F3;
-                    border-radius: 4px;
-                }
-            """)
-        else:
-            # Default styling
-            self.setStyleSheet("""
-                PageListItem {
-                    background-color: white;
-                    border: 1px solid #ddd;
-                    border-radius: 4px;
-                }
-            """)
-
-    def set_selected(self, selected: bool):
-        """Programmatically set selection"""
-        self.checkbox.setChecked(selected)
-        self.update_selection_style()
-
-    def assign_profile(self, profile_name: str):
-        """Assign a profile to this page"""
-        self.page_data.assigned_profile = profile_name
-        self.update_profile_label()
-        self.set_assigned_state(True)
-        self.update_selection_style()
-
-    def set_assigned_state(self, assigned: bool):
-        """Set the assigned state and disable selection if assigned"""
-        if assigned:
-            self.checkbox.setEnabled(False)
-            self.checkbox.setChecked(False)
-            self.update_selection_style()
-        else:
-            self.checkbox.setEnabled(True)
-            self.update_selection_style()
+            parts.append(self.page_data.assigned_profile.lower())
+        # Unit separator keeps a search from matching across two fields
+        self.filter_haystack = "\x1f".join(parts)
 
     def set_selected(self, selected: bool):
         """Programmatically set selection"""
@@ -211,60 +203,97 @@ class PageListItem(QWidget):
     def assign_profile(self, profile_name: str):
         """Assign a profile to this page"""
         self.page_data.assigned_profile = profile_name
+        self.update_filter_haystack()
         self.update_profile_label()
         self.set_assigned_state(True)
+        self.update_selection_style()
 
     def update_profile_label(self):
         """Update the profile assignment label"""
-        if self.page_data.assigned_profile:
+        assigned = bool(self.page_data.assigned_profile)
+        if assigned:
             self.profile_label.setText(f"✓ {self.page_data.assigned_profile}")
-            self.profile_label.setStyleSheet("color: #2196F3; font-size: 9px; font-weight: bold;")
         else:
             self.profile_label.setText("No profile assigned")
-            self.profile_label.setStyleSheet("color: #999; font-size: 9px;")
+
+        if self.profile_label.property("assigned") != assigned:
+            self.profile_label.setProperty("assigned", assigned)
+            self.profile_label.style().unpolish(self.profile_label)
+            self.profile_label.style().polish(self.profile_label)
 
     def set_assigned_state(self, assigned: bool):
         """Set the assigned state and disable selection if assigned"""
         if assigned:
             self.checkbox.setEnabled(False)
             self.checkbox.setChecked(False)
-            self.setStyleSheet("""
-                QWidget {
-                    border: 2px solid #4CAF50;
-                    border-radius: 4px;
-                    background-color: #f8fff8;
-                }
-            """)
         else:
             self.checkbox.setEnabled(True)
-            self.setStyleSheet("""
-                QWidget {
-                    border: 1px solid #ddd;
-                    border-radius: 4px;
-                    background-color: white;
-                }
-                QWidget:hover {
-                    border-color: #2196F3;
-                }
-            """)
+        self.update_selection_style()
 
 
 class PageListWidget(QWidget):
     """Widget for displaying pages in a grid format with bulk selection"""
 
     selection_changed = Signal()  # Emitted when selection changes
+    renames_changed = Signal()  # Emitted when a source PDF rename completes or fails
 
     def __init__(self):
         super().__init__()
         self.page_items: List[PageListItem] = []
+        self._by_source: Dict[str, List[PageListItem]] = defaultdict(list)
+        self._by_data: Dict[int, PageListItem] = {}  # Keyed by id(page_data)
+        self._index_of: Dict[int, int] = {}  # id(item) -> position in page_items
+
+        # Selection flags parallel to page_items, so selected pages can be
+        # picked out with itertools.compress instead of asking every checkbox
+        self._selected = bytearray()
+
+        # Counts for the label are kept up to date per item instead of rescanned
+        self._visible = set()  # ids of items passing the filter
+        self._selected_visible = set()  # ids of visible items that are selected
+
+        self._thumbnail_generation = 0  # Bumped on clear so stale renders are dropped
+        self._thumbnail_signals = ThumbnailWorkerSignals(self)
+        self._thumbnail_signals.thumbnail_ready.connect(self.on_thumbnail_ready)
+        self._thumbnail_signals.finished.connect(self.on_thumbnail_task_finished)
+
+        # Thumbnails render on their own single-thread pool: PyMuPDF doesn't
+        # support several documents being rasterised at once
+        self._thumbnail_pool = QThreadPool(self)
+        self._thumbnail_pool.setMaxThreadCount(1)
+
+        # Render tasks still holding each source PDF, and the event that cancels them
+        self._thumbnail_tasks = Counter()
+        self._thumbnail_cancel: Dict[str, threading.Event] = {}
+
+        # Thumbnails are only rendered for items in or near the viewport, and
+        # items scrolled far away give theirs back
+        self._pending_thumbnails = set()  # Item indices not rendered yet
+        self._shown_thumbnails = set()  # Item indices showing a thumbnail
+        self._thumbnail_timer = QTimer(self)
+        self._thumbnail_timer.setSingleShot(True)
+        self._thumbnail_timer.setInterval(50)
+        self._thumbnail_timer.timeout.connect(self.request_visible_thumbnails)
+
+        # Typing re-filters once the keystrokes pause
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(120)
+        self._filter_timer.timeout.connect(self.apply_current_filter)
+
+        # Sources waiting for their render tasks to finish before being renamed,
+        # mapped to the new path, plus those whose rename is running
+        self._renames_waiting: Dict[str, str] = {}
+        self._renaming = set()
+        self._rename_signals = RenameWorkerSignals(self)
+        self._rename_signals.renamed.connect(self.on_source_renamed)
+        self._rename_signals.failed.connect(self.on_source_rename_failed)
+
         self.setup_ui()
 
     def get_page_item_by_data(self, page_data: PDFPageData) -> 'PageListItem':
         """Get the PageListItem widget for given page data"""
-        for item in self.page_items:
-            if item.page_data == page_data:
-                return item
-        return None
+        return self._by_data.get(id(page_data))
 
     def setup_ui(self):
         layout = QVBoxLayout()
@@ -297,7 +326,7 @@ class PageListWidget(QWidget):
 
         self.filter_input = QLineEdit()
         self.filter_input.setPlaceholderText("Search by filename or page number...")
-        self.filter_input.textChanged.connect(self.apply_filter)
+        self.filter_input.textChanged.connect(self.schedule_filter)
         filter_layout.addWidget(self.filter_input)
 
         controls_layout.addLayout(filter_layout)
@@ -315,97 +344,258 @@ class PageListWidget(QWidget):
 
         # Create scroll area with grid widget
         self.pages_scroll = QScrollArea()
-        self.pages_widget = QWidget()
-        self.pages_grid = QGridLayout(self.pages_widget)
-        self.pages_grid.setSpacing(5)  # Add some spacing between items
-
-        self.pages_scroll.setWidget(self.pages_widget)
         self.pages_scroll.setWidgetResizable(True)
+        self.create_pages_container()
+        self.pages_scroll.verticalScrollBar().valueChanged.connect(self.schedule_visible_thumbnails)
 
         pages_layout.addWidget(self.pages_scroll)
         pages_group.setLayout(pages_layout)
         layout.addWidget(pages_group)
 
         self.setLayout(layout)
+        self.setStyleSheet(PAGE_LIST_STYLE_SHEET)
+
+    def create_pages_container(self):
+        """Put a fresh, empty grid container into the scroll area"""
+        self.pages_widget = QWidget()
+        self.pages_grid = QGridLayout(self.pages_widget)
+        self.pages_grid.setSpacing(5)  # Add some spacing between items
+        self.pages_scroll.setWidget(self.pages_widget)
 
     def load_pages(self, pages: List[PDFPageData]):
         """Load pages into the grid"""
         self.clear_pages()
+        self.append_pages(pages)
 
-        for page_data in pages:
-            self.add_page(page_data)
+    def append_pages(self, pages: List[PDFPageData]):
+        """Append pages to the end of the grid"""
+        pending = []  # Indices still waiting for a rendered thumbnail
 
-        self.update_count_label()
+        with self.bulk_update():
+            for page_data in pages:
+                if not self.add_page_skeleton(page_data):
+                    pending.append(len(self.page_items) - 1)
+
+        # Let the grid paint its placeholders before any rendering is queued
+        if pending:
+            self._pending_thumbnails.update(pending)
+            self.schedule_visible_thumbnails()
 
     def add_page(self, page_data: PDFPageData):
         """Add a single page to the grid"""
-        page_item_widget = PageListItem(page_data)
-        page_item_widget.selection_changed.connect(self.on_selection_changed)
+        if not self.add_page_skeleton(page_data):
+            self._pending_thumbnails.add(len(self.page_items) - 1)
+            self.schedule_visible_thumbnails()
+
+    def add_page_skeleton(self, page_data: PDFPageData) -> bool:
+        """Add a page item to the grid without rendering its thumbnail.
+
+        Returns True if a cached thumbnail was shown, False if the item is
+        showing a placeholder and still needs a thumbnail render.
+        """
+        # Parented up front so the item picks up this widget's style sheet
+        page_item_widget = PageListItem(page_data, self.pages_widget)
+        page_item_widget._owner = self
 
         # Calculate grid position (4 columns)
         row = len(self.page_items) // 4
         col = len(self.page_items) % 4
 
         self.pages_grid.addWidget(page_item_widget, row, col)
+        self._index_of[id(page_item_widget)] = len(self.page_items)
         self.page_items.append(page_item_widget)
+        self._selected.append(page_item_widget.is_selected())
+        self._by_source[page_data.source_path].append(page_item_widget)
+        self._by_data[id(page_data)] = page_item_widget
+        self._visible.add(id(page_item_widget))
+        self.track_selection(page_item_widget)
+
+        if page_item_widget.load_thumbnail():
+            self._shown_thumbnails.add(len(self.page_items) - 1)
+            return True
+        return False
+
+    @contextmanager
+    def bulk_update(self):
+        """Freeze painting and per-item signals for a bulk change, then notify once"""
+        self.setUpdatesEnabled(False)
+        self.pages_widget.setUpdatesEnabled(False)
+        PageListItem._bulk_mode = True
+        try:
+            yield
+        finally:
+            PageListItem._bulk_mode = False
+            self.pages_widget.setUpdatesEnabled(True)
+            self.setUpdatesEnabled(True)
+
+        self.update_count_label()
+        self.selection_changed.emit()
+
+    def schedule_visible_thumbnails(self):
+        """Coalesce scroll, resize and filter changes into one visible-thumbnail pass"""
+        self._thumbnail_timer.start()
+
+    def request_visible_thumbnails(self):
+        """Queue renders for pending items within one screen of the viewport.
+
+        Items more than three screens away (or filtered out) drop their
+        thumbnail, so the pixmaps held stay bounded by QPixmapCache's limit
+        rather than growing with every page scrolled past.
+        """
+        if not self._pending_thumbnails and not self._shown_thumbnails:
+            return
+
+        # Let the grid lay out everything added so far, then let the scroll
+        # area resize it to fit (the grid forwards its request to the viewport)
+        viewport = self.pages_scroll.viewport()
+        QCoreApplication.sendPostedEvents(self.pages_widget, QEvent.LayoutRequest)
+        QCoreApplication.sendPostedEvents(viewport, QEvent.LayoutRequest)
+
+        visible = QRect(self.pages_widget.mapFrom(viewport, QPoint(0, 0)), viewport.size())
+        keep = visible.adjusted(0, -3 * viewport.height(), 0, 3 * viewport.height())
+        visible.adjust(0, -viewport.height(), 0, viewport.height())
+
+        for index in list(self._shown_thumbnails):
+            item = self.page_items[index]
+            if not (item.isVisible() and item.geometry().intersects(keep)):
+                item.release_thumbnail()
+                self._shown_thumbnails.discard(index)
+                self._pending_thumbnails.add(index)
+
+        # One render task per source document so each PDF is opened once;
+        # items coming back into view are usually still in QPixmapCache
+        batches = defaultdict(list)
+        for index in sorted(self._pending_thumbnails):
+            item = self.page_items[index]
+            if item.page_data.source_path in self._renaming:
+                continue  # Rendered once the file has its new name
+            if item.isVisible() and item.geometry().intersects(visible):
+                self._pending_thumbnails.discard(index)
+                if item.load_thumbnail():
+                    self._shown_thumbnails.add(index)
+                else:
+                    batches[item.page_data.source_path].append(index)
+
+        for source_path, indices in batches.items():
+            self.request_thumbnails(source_path, indices)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.schedule_visible_thumbnails()
+
+    def request_thumbnails(self, source_path: str, indices: List[int]):
+        """Render the thumbnails of items from one source PDF on the thread pool"""
+        requests = [
+            (self.page_items[index].page_data.page_number, (self._thumbnail_generation, index))
+            for index in indices
+        ]
+        cancel_event = self._thumbnail_cancel.setdefault(source_path, threading.Event())
+        worker = ThumbnailWorker(
+            source_path,
+            requests,
+            THUMBNAIL_SIZE,
+            self._thumbnail_signals,
+            cancel_event
+        )
+        self._thumbnail_tasks[source_path] += 1
+        self._thumbnail_pool.start(worker)
+
+    def on_thumbnail_ready(self, tag, image: QImage):
+        """Apply a rendered thumbnail unless its page has been cleared since"""
+        generation, index = tag
+        if generation != self._thumbnail_generation:
+            return
+
+        item = self.page_items[index]
+        item.set_thumbnail_image(image)
+        if item.has_thumbnail:
+            self._shown_thumbnails.add(index)
+
+    def on_thumbnail_task_finished(self, source_path: str):
+        """Start a rename that was waiting for the last task reading its source"""
+        self._thumbnail_tasks[source_path] -= 1
+        if self._thumbnail_tasks[source_path] <= 0:
+            del self._thumbnail_tasks[source_path]
+            new_path = self._renames_waiting.pop(source_path, None)
+            if new_path is not None:
+                self.start_rename(source_path, new_path)
 
     def clear_pages(self):
         """Clear all pages from the grid"""
-        # Clear the grid layout
-        for i in reversed(range(self.pages_grid.count())):
-            child = self.pages_grid.takeAt(i).widget()
-            if child:
-                child.deleteLater()
+        # Drop the whole container in one go instead of taking items out of
+        # the grid one by one, which re-lays it out after every removal
+        self.pages_scroll.takeWidget().deleteLater()
+        self.create_pages_container()
 
         self.page_items.clear()
+        self._by_source.clear()
+        self._by_data.clear()
+        self._index_of.clear()
+        self._selected.clear()
+        self._visible.clear()
+        self._selected_visible.clear()
+        self._pending_thumbnails.clear()
+        self._shown_thumbnails.clear()
+        self._thumbnail_generation += 1
+
+        # Stop render tasks of the old pages before their next page
+        for cancel_event in self._thumbnail_cancel.values():
+            cancel_event.set()
+        self._thumbnail_cancel.clear()
         self.update_count_label()
 
     def select_all(self):
         """Select all visible pages"""
-        for item in self.page_items:
-            if not item.isHidden():
-                item.set_selected(True)
+        with self.bulk_update():
+            for item in self.page_items:
+                if not item.isHidden():
+                    item.set_selected(True)
+                    self.track_selection(item)
 
     def clear_all(self):
         """Clear all selections"""
-        for item in self.page_items:
-            item.set_selected(False)
+        with self.bulk_update():
+            for item in self.page_items:
+                item.set_selected(False)
+            self._selected = bytearray(len(self.page_items))
+            self._selected_visible.clear()
 
     def invert_selection(self):
         """Invert current selection"""
-        for item in self.page_items:
-            if not item.isHidden():
-                item.set_selected(not item.is_selected())
+        with self.bulk_update():
+            for item in self.page_items:
+                if not item.isHidden():
+                    item.set_selected(not item.is_selected())
+                    self.track_selection(item)
 
     def get_selected_pages(self) -> List[PDFPageData]:
         """Get list of selected page data"""
-        return [item.page_data for item in self.page_items if item.is_selected()]
+        return [item.page_data for item in compress(self.page_items, self._selected)]
 
     def assign_profile_to_selected(self, profile_name: str, field_values: dict = None):
         """Assign a profile to all selected pages"""
         selected_count = 0
         processed_sources = set()  # Track which sources we've already processed
 
-        for item in self.page_items:
-            if item.is_selected():
-                item.assign_profile(profile_name)
-                if field_values:
-                    item.page_data.profile_field_values = field_values.copy()
-                selected_count += 1
-
-                # Only mark source as processed once, and only if ALL pages from
-                # that source have been assigned profiles
-                source_path = item.page_data.source_path
-                if source_path not in processed_sources:
-                    processed_sources.add(source_path)
-                    # Check if all pages from this source now have profiles assigned
-                    all_assigned = all(
-                        page_item.page_data.assigned_profile is not None
-                        for page_item in self.page_items
-                        if page_item.page_data.source_path == source_path
-                    )
-                    if all_assigned:
-                        self.mark_source_as_processed(source_path)
+        # Snapshot first: assigning unchecks each item and updates the flags
+        for item in list(compress(self.page_items, self._selected)):
+            item.assign_profile(profile_name)
+            if field_values:
+                item.page_data.profile_field_values = field_values.copy()
+            selected_count += 1
+
+            # Only mark source as processed once, and only if ALL pages from
+            # that source have been assigned profiles
+            source_path = item.page_data.source_path
+            if source_path not in processed_sources:
+                processed_sources.add(source_path)
+                # Check if all pages from this source now have profiles assigned
+                all_assigned = all(
+                    page_item.page_data.assigned_profile is not None
+                    for page_item in self._by_source[source_path]
+                )
+                if all_assigned:
+                    self.mark_source_as_processed(source_path)
 
         return selected_count
 
@@ -413,7 +603,7 @@ class PageListWidget(QWidget):
         """Assign a profile to selected pages and mark them as a batch group"""
         from src.models.index_profile import IndexProfile
 
-        selected_items = [item for item in self.page_items if item.is_selected()]
+        selected_items = list(compress(self.page_items, self._selected))
 
         if not selected_items:
             return 0
@@ -436,56 +626,116 @@ class PageListWidget(QWidget):
     def mark_source_as_processed(self, source_path: str):
         """Mark source PDF as processed by adding 'done-' prefix"""
         from pathlib import Path
-        import os
 
         path = Path(source_path)
-        if not path.name.startswith("done-"):
+        if not path.name.startswith("done-") and source_path not in self._renaming:
             new_name = f"done-{path.name}"
             new_path = path.parent / new_name
-            try:
-                os.rename(str(path), str(new_path))
-                # Update all page items with this source path
-                for item in self.page_items:
-                    if item.page_data.source_path == source_path:
-                        item.page_data.source_path = str(new_path)
-            except OSError:
-                pass  # Handle file in use or permission errors silently
+            self._renaming.add(source_path)
 
-    def apply_filter(self, filter_text: str):
-        """Filter pages based on search text"""
-        filter_text = filter_text.lower().strip()
+            # Render tasks may still have the file open (which blocks renaming
+            # on Windows): cancel them and rename once the last one is done
+            cancel_event = self._thumbnail_cancel.pop(source_path, None)
+            if cancel_event is not None:
+                cancel_event.set()
 
-        for item in self.page_items:
-            if not filter_text:
-                # Show all if no filter
-                item.show()
+            if self._thumbnail_tasks[source_path] > 0:
+                self._renames_waiting[source_path] = str(new_path)
             else:
-                # Check if filter matches filename or page number
-                page_data = item.page_data
-                filename = page_data.source_filename.lower()
-                page_num = str(page_data.page_number + 1)
+                self.start_rename(source_path, str(new_path))
+
+    def start_rename(self, old_path: str, new_path: str):
+        """Rename a source PDF on the pool; items are updated once it has succeeded"""
+        worker = RenameWorker(old_path, new_path, self._rename_signals)
+        QThreadPool.globalInstance().start(worker)
+
+    def has_pending_renames(self) -> bool:
+        """Whether any source PDF is still waiting to be renamed"""
+        return bool(self._renaming)
+
+    def on_source_rename_failed(self, old_path: str):
+        """Keep the old path for a source that couldn't be renamed"""
+        self._renaming.discard(old_path)
+        self.requeue_thumbnails(self._by_source.get(old_path, []))
+        self.renames_changed.emit()
+
+    def requeue_thumbnails(self, items: List[PageListItem]):
+        """Put items whose render was cancelled back in line for a thumbnail"""
+        self._pending_thumbnails.update(
+            self._index_of[id(item)] for item in items if not item.has_thumbnail
+        )
+        self.schedule_visible_thumbnails()
+
+    def on_source_renamed(self, old_path: str, new_path: str):
+        """Point all page items of a renamed source PDF at its new path"""
+        self._renaming.discard(old_path)
+        items = self._by_source.pop(old_path, [])
+        for item in items:
+            # Carry the cached thumbnail over to the key for the new path
+            old_key = item.thumbnail_cache_key()
+            pixmap = QPixmapCache.find(old_key)
+
+            item.page_data.source_path = new_path
+            item.update_filter_haystack()
+
+            if pixmap is not None:
+                QPixmapCache.remove(old_key)
+                QPixmapCache.insert(item.thumbnail_cache_key(), pixmap)
+
+        if items:
+            self._by_source[new_path].extend(items)
+
+        self.requeue_thumbnails(items)
+        self.renames_changed.emit()
 
-                matches = (filter_text in filename or
-                           filter_text in page_num or
-                           (page_data.assigned_profile and
-                            filter_text in page_data.assigned_profile.lower()))
+    def schedule_filter(self):
+        """Restart the filter debounce timer"""
+        self._filter_timer.start()
 
+    def apply_current_filter(self):
+        """Filter pages by the current contents of the filter box"""
+        self.apply_filter(self.filter_input.text())
+
+    def apply_filter(self, filter_text: str):
+        """Filter pages based on search text"""
+        filter_text = filter_text.lower().strip()
+
+        with self.bulk_update():
+            for item in self.page_items:
+                # Match filename, page number or assigned profile
+                matches = not filter_text or filter_text in item.filter_haystack
                 item.setVisible(matches)
 
-        self.update_count_label()
+                # Only items whose visibility flipped touch the counts
+                if (id(item) in self._visible) != matches:
+                    if matches:
+                        self._visible.add(id(item))
+                    else:
+                        self._visible.discard(id(item))
+                    self.track_selection(item)
 
-    def on_selection_changed(self):
+        self.schedule_visible_thumbnails()
+
+    def on_item_selection_changed(self, item: PageListItem):
         """Handle selection change from individual items"""
+        self.track_selection(item)
         self.update_count_label()
         self.selection_changed.emit()
 
+    def track_selection(self, item: PageListItem):
+        """Update the selection flag and selected-visible count for one item"""
+        self._selected[self._index_of[id(item)]] = item.is_selected()
+
+        if id(item) in self._visible and item.is_selected():
+            self._selected_visible.add(id(item))
+        else:
+            self._selected_visible.discard(id(item))
+
     def update_count_label(self):
         """Update the selection count label"""
-        total_visible = sum(1 for item in self.page_items if not item.isHidden())
-        selected_visible = sum(1 for item in self.page_items
-                               if not item.isHidden() and item.is_selected())
-
-        self.count_label.setText(f"{selected_visible} of {total_visible} pages selected")
+        self.count_label.setText(
+            f"{len(self._selected_visible)} of {len(self._visible)} pages selected"
+        )
 
     def get_all_pages(self) -> List[PDFPageData]:
         """Get all page data"""
@@ -1,84 +1,321 @@
-from PySide6.QtCore import QThread, Signal
-from typing import List
-
+import os
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from PySide6.QtCore import Qt, QObject, QRunnable, QSize, QThread, Signal, Slot
+from PySide6.QtGui import QImage
+from typing import Dict, List, Optional, Tuple
+
+from src.models.index_profile import IndexProfile
 from src.models.pdf_page import PDFPageData, ExportJob
 from src.services.pdf_service import PDFService
 from src.services.export_service import ExportService
+from src.utils.file_utils import FileUtils
+
+
+class PDFLoader(QObject):
+    """Persistent background worker for loading PDF files and pages.
 
+    The worker is moved to a long-lived QThread once and receives folder scans
+    through request_load(). A newer request (or stop()) cancels any scan that
+    is still in flight.
+    """
 
-class PDFLoader(QThread):
-    """Background thread for loading PDF files and pages"""
+    CHUNK_SIZE = 50  # Max pages per pages_chunk emission
 
     progress = Signal(str)  # Progress message
-    pages_loaded = Signal(list)  # List of PDFPageData
+    pages_chunk = Signal(list, int)  # List of PDFPageData, scan generation
+    pages_loaded = Signal(int)  # Total pages loaded
     finished = Signal()
     error = Signal(str)
+    _load_requested = Signal(str, int)  # folder_path, generation
 
-    def __init__(self, folder_path: str):
+    def __init__(self):
         super().__init__()
-        self.folder_path = folder_path
-        self._stop_requested = False
+        self._generation = 0
+        self._load_requested.connect(self.load_folder)
+
+    def request_load(self, folder_path: str):
+        """Queue a folder scan on the worker thread, cancelling the current one"""
+        self._generation += 1
+        self._load_requested.emit(folder_path, self._generation)
 
     def stop(self):
-        """Request thread to stop"""
-        self._stop_requested = True
+        """Request the current scan to stop"""
+        self._generation += 1
 
-    def run(self):
-        try:
-            if self._stop_requested:
-                return
+    @property
+    def generation(self) -> int:
+        """Generation of the most recent request; stale chunks carry an older one"""
+        return self._generation
+
+    def _is_cancelled(self, generation: int) -> bool:
+        return generation != self._generation
+
+    @Slot(str, int)
+    def load_folder(self, folder_path: str, generation: int):
+        if self._is_cancelled(generation):
+            return
 
-            self.progress.emit(f"Scanning folder: {self.folder_path}")
+        try:
+            self.progress.emit(f"Scanning folder: {folder_path}")
 
             # Find PDF files
-            pdf_files = PDFService.find_pdf_files(self.folder_path)
+            pdf_files = PDFService.find_pdf_files(folder_path)
 
             if not pdf_files:
                 self.error.emit("No PDF files found in the selected folder.")
                 return
 
-            if self._stop_requested:
+            if self._is_cancelled(generation):
                 return
 
             self.progress.emit(f"Found {len(pdf_files)} PDF files. Loading pages...")
 
-            # Load pages from all PDFs
-            all_pages = []
-
+            # Load pages from all PDFs, streaming each file out as soon as it is
+            # loaded (large files in several chunks). Files are opened one at a
+            # time: PyMuPDF holds the GIL and doesn't support concurrent use.
+            total_pages = 0
             for i, pdf_file in enumerate(pdf_files):
-                if self._stop_requested:
+                if self._is_cancelled(generation):
                     return
 
                 self.progress.emit(f"Processing {pdf_file.name} ({i + 1}/{len(pdf_files)})")
 
                 try:
                     pages = PDFService.load_pages_from_file(str(pdf_file))
-                    all_pages.extend(pages)
+                    total_pages += len(pages)
                     self.progress.emit(f"  Loaded {len(pages)} pages from {pdf_file.name}")
+
+                    for start in range(0, len(pages), self.CHUNK_SIZE):
+                        if self._is_cancelled(generation):
+                            return
+                        self.pages_chunk.emit(pages[start:start + self.CHUNK_SIZE], generation)
                 except Exception as e:
                     self.progress.emit(f"  Error loading {pdf_file.name}: {str(e)}")
                     continue
 
-            if self._stop_requested:
+            if self._is_cancelled(generation):
                 return
 
-            if all_pages:
-                self.progress.emit(f"Successfully loaded {len(all_pages)} pages total.")
-                self.pages_loaded.emit(all_pages)
+            if total_pages:
+                self.progress.emit(f"Successfully loaded {total_pages} pages total.")
+                self.pages_loaded.emit(total_pages)
             else:
                 self.error.emit("No valid pages found in PDF files.")
 
         except Exception as e:
-            if not self._stop_requested:
+            if not self._is_cancelled(generation):
                 self.error.emit(f"Error loading PDFs: {str(e)}")
         finally:
-            self.finished.emit()
+            # A superseded scan stays quiet; the newer request reports completion
+            if not self._is_cancelled(generation):
+                self.finished.emit()
+
+
+class ThumbnailWorkerSignals(QObject):
+    """Signals for ThumbnailWorker, shared by all workers of one view"""
+
+    thumbnail_ready = Signal(object, QImage)  # Request tag, scaled image (null on failure)
+    finished = Signal(str)  # PDF path, once the task has closed it
+
+
+class ThumbnailWorker(QRunnable):
+    """Pool task that renders thumbnails for a batch of pages from one PDF.
+
+    The document is opened once for the whole batch and each page is
+    rasterised straight at the display size, then emitted as soon as it is
+    ready. QImage (unlike QPixmap) is safe to build off the GUI thread; the
+    receiver converts it to a pixmap.
+
+    Setting the optional cancel event stops the task before its next page is
+    rasterised.
+    """
+
+    def __init__(self, pdf_path: str, requests: List[Tuple[int, object]], size: QSize,
+                 signals: ThumbnailWorkerSignals, cancel_event: Optional[threading.Event] = None):
+        super().__init__()
+        self.pdf_path = pdf_path
+        self.requests = requests  # (page_number, tag) pairs
+        self.size = size
+        self.signals = signals
+        self.cancel_event = cancel_event
+
+    def _is_cancelled(self) -> bool:
+        return self.cancel_event is not None and self.cancel_event.is_set()
+
+    def run(self):
+        try:
+            if not self._is_cancelled():
+                self.render()
+        finally:
+            self.signals.finished.emit(self.pdf_path)
+
+    def render(self):
+        tags = dict(self.requests)
+        thumbnails = PDFService.iter_page_thumbnails(
+            self.pdf_path, list(tags), target_size=(self.size.width(), self.size.height())
+        )
+
+        try:
+            for page_number, img_data in thumbnails:
+                image = QImage()
+                if img_data and image.loadFromData(img_data, "PNG"):
+                    # Rounding in the rasteriser can overshoot by a pixel
+                    if image.width() > self.size.width() or image.height() > self.size.height():
+                        image = image.scaled(self.size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+                self.signals.thumbnail_ready.emit(tags[page_number], image)
+
+                if self._is_cancelled():
+                    break
+        finally:
+            thumbnails.close()  # Closes the PDF if we stopped early
+
+
+class RenameWorkerSignals(QObject):
+    """Signals for RenameWorker"""
+
+    renamed = Signal(str, str)  # Old path, new path
+    failed = Signal(str)  # Old path
+
+
+class RenameWorker(QRunnable):
+    """Pool task that renames a file so slow or locked drives don't block the GUI"""
+
+    def __init__(self, old_path: str, new_path: str, signals: RenameWorkerSignals):
+        super().__init__()
+        self.old_path = old_path
+        self.new_path = new_path
+        self.signals = signals
+
+    def run(self):
+        try:
+            os.rename(self.old_path, self.new_path)
+        except OSError:
+            # File in use or permission errors leave the source as it is
+            self.signals.failed.emit(self.old_path)
+            return
+
+        self.signals.renamed.emit(self.old_path, self.new_path)
+
+
+class ExportJobBuilderSignals(QObject):
+    """Signals for ExportJobBuilder (QRunnable can't define its own)"""
+
+    progress = Signal(str)  # Progress message
+    jobs_ready = Signal(list)  # List of ExportJob
+    error = Signal(str)
+
+
+class ExportJobBuilder(QRunnable):
+    """Pool task that groups assigned pages into export jobs off the GUI thread"""
+
+    def __init__(self, pages: List[PDFPageData], profiles: Dict[str, IndexProfile],
+                 default_output_folder: Optional[str]):
+        super().__init__()
+        self.pages = pages
+        self.profiles = profiles
+        self.default_output_folder = default_output_folder
+        self.signals = ExportJobBuilderSignals()
+
+    def run(self):
+        try:
+            self.signals.jobs_ready.emit(self.build_jobs())
+        except Exception as e:
+            self.signals.error.emit(f"Error building export jobs: {str(e)}")
+
+    def build_jobs(self) -> List[ExportJob]:
+        """Group pages by output file and create one batch job per group"""
+        # Group pages by their batch_id if they have one, otherwise individual files
+        profile_groups = defaultdict(list)
+        path_cache = {}  # (profile, output base, field values) -> output path
+
+        for page_data in self.pages:
+            try:
+                profile = self.profiles.get(page_data.assigned_profile)
+                if profile:
+                    # Use profile's output folder if set, otherwise use app's output folder
+                    output_base = profile.output_folder or self.default_output_folder
+
+                    # Generate base output path using profile with page-specific field values
+                    field_values = page_data.profile_field_values
+                    if field_values:
+                        self.signals.progress.emit(f"Using stored field values for page {page_data.page_number + 1}")
+                    else:
+                        self.signals.progress.emit(
+                            f"No stored field values for page {page_data.page_number + 1}, using current profile values")
+
+                    # Pages assigned together share field values, so reuse the generated path
+                    cache_key = (page_data.assigned_profile, output_base, tuple(sorted(field_values.items())))
+                    output_path = path_cache.get(cache_key)
+                    if output_path is None:
+                        if field_values:
+                            output_path = profile.generate_output_path_with_values(output_base, field_values)
+                        else:
+                            output_path = profile.generate_output_path(output_base)
+                        path_cache[cache_key] = output_path
+
+                    if not output_path.endswith('.pdf'):
+                        output_path += '.pdf'
+
+                    # Group by batch_id if present, otherwise use individual paths
+                    if page_data.batch_id:
+                        # For batch items, use batch_id as the grouping key (before .pdf extension)
+                        base_path = output_path.replace('.pdf', '')
+                        group_key = f"{base_path}.pdf"
+                    else:
+                        # For individual items, make each page unique
+                        base_path = output_path.replace('.pdf', '')
+                        group_key = f"{base_path}_{page_data.page_number}.pdf"
+
+                    profile_groups[group_key].append(page_data)
+
+            except Exception as e:
+                self.signals.progress.emit(f"Error processing page {page_data.page_number + 1}: {str(e)}")
+                continue
+
+        # Ensure unique filenames, listing each output directory only once
+        paths_by_dir = defaultdict(list)
+        for output_path in profile_groups:
+            paths_by_dir[str(Path(output_path).parent)].append(output_path)
+
+        unique_paths = {}
+        for directory, paths in paths_by_dir.items():
+            names = [Path(p).name for p in paths]
+            unique_paths.update(zip(paths, FileUtils.batch_ensure_unique(directory, names)))
+
+        # Create batch export jobs - one job per group
+        export_jobs = []
+        for output_path, pages_group in profile_groups.items():
+            try:
+                final_output_path = unique_paths[output_path]
+
+                # Create a single job that will contain all pages for this profile/path
+                job = ExportJob(
+                    source_path="BATCH",  # Special marker for batch jobs
+                    page_number=0,  # Not used for batch jobs
+                    output_path=final_output_path,
+                    pages_group=tuple(pages_group)
+                )
+                export_jobs.append(job)
+                self.signals.progress.emit(f"Created export job: {final_output_path}")
+
+            except Exception as e:
+                self.signals.progress.emit(f"Error creating export job for {output_path}: {str(e)}")
+                continue
+
+        return export_jobs
 
 
 class PDFExporter(QThread):
     """Background thread for exporting PDF pages"""
 
+    PROGRESS_INTERVAL = 0.05  # Min seconds between per-job progress updates
+
     progress = Signal(str)  # Progress message
+    progress_batch = Signal(int, int, str)  # Jobs done, total jobs, latest result message
     export_complete = Signal(list)  # Export results
     finished = Signal()
     error = Signal(str)
@@ -87,11 +324,19 @@ class PDFExporter(QThread):
         super().__init__()
         self.export_jobs = export_jobs
         self._stop_requested = False
+        self._last_progress = 0.0
 
     def stop(self):
         """Request thread to stop"""
         self._stop_requested = True
 
+    def _report_progress(self, done: int, total: int, message: str, force: bool = False):
+        """Emit per-job progress at most every PROGRESS_INTERVAL unless forced"""
+        now = time.monotonic()
+        if force or now - self._last_progress >= self.PROGRESS_INTERVAL:
+            self._last_progress = now
+            self.progress_batch.emit(done, total, message)
+
     def run(self):
         try:
             if self._stop_requested:
@@ -99,6 +344,9 @@ class PDFExporter(QThread):
 
             self.progress.emit(f"Starting export of {len(self.export_jobs)} pages...")
 
+            # Output folders are checked on disk once per run, then remembered
+            FileUtils.reset_ensured_directories()
+
             # Validate jobs first
             errors = ExportService.validate_export_jobs(self.export_jobs)
             if errors:
@@ -112,25 +360,25 @@ class PDFExporter(QThread):
             preview = ExportService.get_output_preview(self.export_jobs)
             self.progress.emit(f"Will create {preview['total_files']} files in {len(preview['folders'])} folders")
 
-            # Export pages
+            # Export pages one job at a time: PyMuPDF holds the GIL and doesn't
+            # support concurrent use, so a pool wouldn't run jobs in parallel
+            total = len(self.export_jobs)
+            prefix_ok, prefix_fail = "✓ Exported: ", "✗ Failed: "
             results = []
 
-            for i, job in enumerate(self.export_jobs):
+            for done, job in enumerate(self.export_jobs, start=1):
                 if self._stop_requested:
                     return
 
-                self.progress.emit(f"Exporting page {i + 1}/{len(self.export_jobs)}: {job.output_path}")
-
                 success = ExportService.export_page(job)
+                message = (prefix_ok if success else prefix_fail) + job.output_path
 
-                result = {
-                    'job': job,
-                    'success': success,
-                    'message': f"✓ Exported: {job.output_path}" if success else f"✗ Failed: {job.output_path}"
-                }
+                results.append({'job': job, 'success': success, 'message': message})
 
-                results.append(result)
-                self.progress.emit(result['message'])
+                # Throttled so big exports don't flood the GUI; failures and the
+                # last job are always reported
+                self._report_progress(done, total, message,
+                                      force=not success or done == total)
 
             if self._stop_requested:
                 return
@@ -1,7 +1,23 @@
 import os
 import re
+import shutil
+import time
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+
+# Characters invalid in Windows/Unix filenames, each mapped to '_'
+_INVALID_FILENAME_CHARS = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+_INVALID_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+
+# Free space per directory: (time looked up, GB free); reused for a short while
+_SPACE_CACHE_TTL = 2.0  # seconds
+_space_cache: Dict[str, Tuple[float, float]] = {}
+
+# Directories already found writable by validate_output_path this export run
+_WRITABLE_DIRS = set()
+
+# Directories already created (or found to exist) this export run
+_ENSURED_DIRS = set()
 
 
 class FileUtils:
@@ -10,12 +26,11 @@ class FileUtils:
     @staticmethod
     def sanitize_filename(filename: str) -> str:
         """Remove invalid characters from filename"""
-        # Remove invalid characters for Windows/Unix
-        invalid_chars = r'[<>:"/\\|?*]'
-        sanitized = re.sub(invalid_chars, '_', filename)
-
-        # Remove leading/trailing whitespace and dots
-        sanitized = sanitized.strip('. ')
+        # Replace invalid characters (most names have none, so skip the copy),
+        # then remove leading/trailing whitespace and dots
+        if _INVALID_FILENAME_RE.search(filename) is not None:
+            filename = filename.translate(_INVALID_FILENAME_CHARS)
+        sanitized = filename.strip('. ')
 
         # Ensure filename isn't empty
         if not sanitized:
@@ -32,23 +47,60 @@ class FileUtils:
         """Ensure filename is unique by adding numbers if needed"""
         path = Path(filepath)
 
+        if not path.exists():
+            return filepath
+
+        # Resolve against one directory listing instead of a stat per counter
+        return FileUtils.batch_ensure_unique(str(path.parent), [path.name])[0]
+
+    @staticmethod
+    def _probe_unique_filename(filepath: str) -> str:
+        """Find a free name by probing the filesystem for each counter value"""
+        path = Path(filepath)
+        stem, suffix, parent = path.stem, path.suffix, path.parent
+
         if not path.exists():
             return filepath
 
         counter = 1
         while True:
-            stem = path.stem
-            suffix = path.suffix
-            parent = path.parent
-
-            new_name = f"{stem}_{counter}{suffix}"
-            new_path = parent / new_name
+            new_path = parent / f"{stem}_{counter}{suffix}"
 
             if not new_path.exists():
                 return str(new_path)
 
             counter += 1
 
+    @staticmethod
+    def batch_ensure_unique(directory: str, filenames: List[str]) -> List[str]:
+        """Make several filenames unique within one directory using a single listing
+
+        Returns the resulting full paths in the same order as filenames. Names
+        chosen earlier in the batch are reserved for later ones as well.
+        """
+        try:
+            existing = {os.path.normcase(name) for name in os.listdir(directory)}
+        except FileNotFoundError:
+            existing = set()
+        except OSError:
+            # Directory can't be listed - fall back to probing each file
+            return [FileUtils._probe_unique_filename(str(Path(directory) / name)) for name in filenames]
+
+        unique_paths = []
+        for name in filenames:
+            candidate = name
+            if os.path.normcase(candidate) in existing:
+                stem, suffix = Path(name).stem, Path(name).suffix
+                counter = 1
+                while os.path.normcase(f"{stem}_{counter}{suffix}") in existing:
+                    counter += 1
+                candidate = f"{stem}_{counter}{suffix}"
+
+            existing.add(os.path.normcase(candidate))
+            unique_paths.append(str(Path(directory) / candidate))
+
+        return unique_paths
+
     @staticmethod
     def get_relative_path(file_path: str, base_path: str) -> str:
         """Get relative path from base path"""
@@ -57,11 +109,27 @@ class FileUtils:
         except ValueError:
             return str(Path(file_path).name)
 
+    @staticmethod
+    def ensure_directory(directory) -> None:
+        """Create a directory (and parents) unless it was already ensured; raises OSError"""
+        key = str(directory)
+        if key in _ENSURED_DIRS:
+            return
+
+        Path(key).mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(key)
+
+    @staticmethod
+    def reset_ensured_directories():
+        """Forget ensured (and writable) directories so the next checks hit the disk again"""
+        _ENSURED_DIRS.clear()
+        _WRITABLE_DIRS.clear()
+
     @staticmethod
     def create_directory_structure(path: str) -> bool:
         """Create directory structure if it doesn't exist"""
         try:
-            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            FileUtils.ensure_directory(Path(path).parent)
             return True
         except Exception as e:
             print(f"Error creating directory structure for {path}: {e}")
@@ -82,8 +150,12 @@ class FileUtils:
         try:
             path = Path(output_path)
 
+            parent = str(path.parent)
+            if parent in _WRITABLE_DIRS:
+                return True, None
+
             # Check if parent directory can be created
-            path.parent.mkdir(parents=True, exist_ok=True)
+            FileUtils.ensure_directory(parent)
 
             # Check if we can write to the location
             test_file = path.parent / "test_write.tmp"
@@ -93,6 +165,8 @@ class FileUtils:
             except Exception:
                 return False, "Cannot write to output directory"
 
+            # Only successes are remembered, so a fixed permission is picked up
+            _WRITABLE_DIRS.add(parent)
             return True, None
 
         except Exception as e:
@@ -101,10 +175,17 @@ class FileUtils:
     @staticmethod
     def get_available_space_gb(path: str) -> float:
         """Get available disk space in GB"""
+        directory = str(Path(path).parent)
+        now = time.monotonic()
+
+        cached = _space_cache.get(directory)
+        if cached and now - cached[0] < _SPACE_CACHE_TTL:
+            return cached[1]
+
         try:
-            stat = os.statvfs(str(Path(path).parent))
-            # Available space = fragment size * available fragments
-            available_bytes = stat.f_frsize * stat.f_bavail
-            return available_bytes / (1024 * 1024 * 1024)
+            available_gb = shutil.disk_usage(directory).free / (1024 * 1024 * 1024)
         except Exception:
-            return 0.0
\ No newline at end of file
+            return 0.0
+
+        _space_cache[directory] = (now, available_gb)
+        return available_gb
\ No newline at end of file
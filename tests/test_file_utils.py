@@ -0,0 +1,73 @@
+import os
+
+import pytest
+
+from src.utils.file_utils import FileUtils
+
+# Permission bits only stop writes on POSIX, and never for root
+read_only_folders = pytest.mark.skipif(
+    os.name != "posix" or os.geteuid() == 0,
+    reason="needs POSIX permissions and a non-root user",
+)
+
+
+def test_batch_ensure_unique_keeps_free_names(tmp_path):
+    paths = FileUtils.batch_ensure_unique(str(tmp_path), ["a.pdf", "b.pdf"])
+
+    assert paths == [str(tmp_path / "a.pdf"), str(tmp_path / "b.pdf")]
+
+
+def test_batch_ensure_unique_skips_existing_files(tmp_path):
+    (tmp_path / "a.pdf").touch()
+    (tmp_path / "a_1.pdf").touch()
+
+    assert FileUtils.batch_ensure_unique(str(tmp_path), ["a.pdf"]) == [str(tmp_path / "a_2.pdf")]
+
+
+def test_batch_ensure_unique_reserves_names_within_the_batch(tmp_path):
+    paths = FileUtils.batch_ensure_unique(str(tmp_path), ["a.pdf", "a.pdf", "a.pdf"])
+
+    assert paths == [str(tmp_path / "a.pdf"), str(tmp_path / "a_1.pdf"), str(tmp_path / "a_2.pdf")]
+
+
+def test_batch_ensure_unique_is_case_insensitive_where_the_filesystem_is(tmp_path, monkeypatch):
+    # Simulate Windows, where normcase folds case
+    monkeypatch.setattr(os.path, "normcase", str.lower)
+    (tmp_path / "Report.PDF").touch()
+
+    paths = FileUtils.batch_ensure_unique(str(tmp_path), ["report.pdf", "REPORT.pdf"])
+
+    assert paths == [str(tmp_path / "report_1.pdf"), str(tmp_path / "REPORT_2.pdf")]
+
+
+def test_batch_ensure_unique_handles_a_missing_directory(tmp_path):
+    missing = tmp_path / "new"
+
+    assert FileUtils.batch_ensure_unique(str(missing), ["a.pdf"]) == [str(missing / "a.pdf")]
+
+
+@read_only_folders
+def test_read_only_folders_are_rejected(tmp_path):
+    folder = tmp_path / "out"
+    folder.mkdir()
+    folder.chmod(0o555)
+    try:
+        assert FileUtils.validate_output_path(str(folder / "a.pdf")) == (False, "Cannot write to output directory")
+    finally:
+        folder.chmod(0o755)
+
+
+@read_only_folders
+def test_writable_folders_are_checked_again_after_reset(tmp_path):
+    folder = tmp_path / "out"
+    output_path = str(folder / "a.pdf")
+    assert FileUtils.validate_output_path(output_path) == (True, None)
+
+    folder.chmod(0o555)
+    try:
+        assert FileUtils.validate_output_path(output_path) == (True, None)  # Remembered
+
+        FileUtils.reset_ensured_directories()
+        assert FileUtils.validate_output_path(output_path) == (False, "Cannot write to output directory")
+    finally:
+        folder.chmod(0o755)
@@ -0,0 +1,61 @@
+import fitz
+import pytest
+
+from src.models.pdf_page import ExportJob, PDFPageData
+from src.services.export_service import ExportService
+from src.ui.workers import PDFExporter
+
+
+@pytest.fixture
+def source_pdf(tmp_path):
+    path = tmp_path / "source.pdf"
+    doc = fitz.open()
+    for _ in range(4):
+        doc.new_page()
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+def make_jobs(source_pdf, output_dir):
+    return [
+        ExportJob(
+            source_path="BATCH",
+            page_number=0,
+            output_path=str(output_dir / f"page_{i}.pdf"),
+            pages_group=(PDFPageData(source_path=source_pdf, page_number=i),)
+        )
+        for i in range(4)
+    ]
+
+
+def run_exporter(jobs):
+    exporter = PDFExporter(jobs)
+    results = []
+    exporter.export_complete.connect(results.extend)
+    exporter.run()  # Synchronously, on this thread
+    return results
+
+
+def test_results_follow_job_order(source_pdf, tmp_path):
+    jobs = make_jobs(source_pdf, tmp_path / "out")
+
+    results = run_exporter(jobs)
+
+    assert [r['job'] for r in results] == jobs
+    assert all(r['success'] for r in results)
+    for job in jobs:
+        assert fitz.open(job.output_path).page_count == 1
+
+
+def test_failed_jobs_keep_their_place(source_pdf, tmp_path, monkeypatch):
+    jobs = make_jobs(source_pdf, tmp_path / "out")
+    export_page = ExportService.export_page
+    monkeypatch.setattr(ExportService, "export_page",
+                        staticmethod(lambda job: job is not jobs[1] and export_page(job)))
+
+    results = run_exporter(jobs)
+
+    assert [r['job'] for r in results] == jobs
+    assert [r['success'] for r in results] == [True, False, True, True]
+    assert results[1]['message'] == f"✗ Failed: {jobs[1].output_path}"
@@ -0,0 +1,34 @@
+import pytest
+
+from src.models.index_profile import IndexProfile, ProfileManager
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    # Profiles are stored under ~/.config on Linux
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return ProfileManager()
+
+
+def test_get_profile_finds_default_profiles(manager):
+    assert manager.get_profile("Basic Document") is manager.profiles[0]
+    assert manager.get_profile("Missing") is None
+
+
+def test_get_profile_after_rename_in_place(manager):
+    profile = manager.get_profile("Basic Document")
+
+    # The profile editor renames profiles by editing the object directly
+    profile.name = "Letters"
+
+    assert manager.get_profile("Letters") is profile
+    assert manager.get_profile("Basic Document") is None
+
+
+def test_get_profile_after_add_and_remove(manager):
+    added = IndexProfile("Receipts")
+    manager.add_profile(added)
+    assert manager.get_profile("Receipts") is added
+
+    assert manager.remove_profile("Receipts")
+    assert manager.get_profile("Receipts") is None
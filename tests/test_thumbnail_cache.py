@@ -0,0 +1,87 @@
+import os
+import time
+
+import pytest
+
+from src.services.thumbnail_cache import ThumbnailCache
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "thumbs"
+    monkeypatch.setattr(ThumbnailCache, "_cache_dir", directory)
+    monkeypatch.setattr(ThumbnailCache, "_created_dirs", set())
+    ThumbnailCache.clear_memory()
+    yield directory
+    ThumbnailCache.clear_memory()
+
+
+@pytest.fixture
+def source_key(tmp_path):
+    pdf = tmp_path / "doc.pdf"
+    pdf.write_bytes(b"%PDF-1.4")
+    return ThumbnailCache.source_key(str(pdf))
+
+
+def test_source_key_is_none_for_missing_files(tmp_path):
+    assert ThumbnailCache.source_key(str(tmp_path / "missing.pdf")) is None
+
+
+def test_store_and_load_from_disk(cache_dir, source_key):
+    ThumbnailCache.store(source_key, 0, "78x98", b"png-0")
+    ThumbnailCache.clear_memory()
+
+    assert ThumbnailCache.load(source_key, 0, "78x98") == b"png-0"
+    assert ThumbnailCache.load(source_key, 0, "120x150") is None
+    assert ThumbnailCache.load(source_key, 1, "78x98") is None
+    assert len(list(cache_dir.rglob("*.png"))) == 1
+
+
+def test_changed_source_misses(cache_dir, tmp_path, source_key):
+    ThumbnailCache.store(source_key, 0, "78x98", b"png-0")
+
+    pdf = tmp_path / "doc.pdf"
+    stat = pdf.stat()
+    os.utime(pdf, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert ThumbnailCache.load(ThumbnailCache.source_key(str(pdf)), 0, "78x98") is None
+
+
+def test_prune_removes_only_old_entries(cache_dir, source_key):
+    ThumbnailCache.store(source_key, 0, "78x98", b"old")
+    ThumbnailCache.store(source_key, 1, "78x98", b"new")
+
+    old_entry = ThumbnailCache._entry_path(source_key, 0, "78x98")
+    old_time = time.time() - (ThumbnailCache.MAX_AGE_DAYS + 1) * 86400
+    os.utime(old_entry, (old_time, old_time))
+
+    ThumbnailCache.prune()
+    ThumbnailCache.clear_memory()
+
+    assert not old_entry.exists()
+    assert ThumbnailCache.load(source_key, 1, "78x98") == b"new"
+
+
+def test_memory_hit_does_not_read_disk(cache_dir, source_key):
+    ThumbnailCache.store(source_key, 0, "78x98", b"png-0")
+
+    for entry in cache_dir.rglob("*.png"):
+        entry.unlink()
+
+    assert ThumbnailCache.load(source_key, 0, "78x98") == b"png-0"
+
+
+def test_memory_keeps_the_most_recently_used_entries(cache_dir, source_key, monkeypatch):
+    monkeypatch.setattr(ThumbnailCache, "MEMORY_ENTRIES", 2)
+
+    ThumbnailCache.store(source_key, 0, "78x98", b"png-0")
+    ThumbnailCache.store(source_key, 1, "78x98", b"png-1")
+    ThumbnailCache.load(source_key, 0, "78x98")  # Page 0 becomes most recent
+    ThumbnailCache.store(source_key, 2, "78x98", b"png-2")  # Evicts page 1
+
+    for entry in cache_dir.rglob("*.png"):
+        entry.unlink()
+
+    assert ThumbnailCache.load(source_key, 0, "78x98") == b"png-0"
+    assert ThumbnailCache.load(source_key, 1, "78x98") is None
+    assert ThumbnailCache.load(source_key, 2, "78x98") == b"png-2"